@@ -142,7 +142,8 @@ class ContentGenerator:
             if use_calendar:
                 based_on.append("calendar")
 
-            proposal = ContentProposal(
+            # All fields are produced internally, so skip re-validation
+            proposal = ContentProposal.model_construct(
                 content_type=content_type,
                 content=content,
                 suggested_date=suggested_date,
@@ -154,8 +155,8 @@ class ContentGenerator:
                 virality_score=virality_result.score,
                 virality_breakdown=virality_result.components,
                 virality_notes=virality_result.notes,
-                health_impact=health_impact.impacts,
-                followup_formats=health_impact.followups,
+                health_impact=list(health_impact.impacts),
+                followup_formats=list(health_impact.followups),
             )
 
             proposals.append(proposal)
@@ -119,7 +119,8 @@ class VoiceAnalyzer:
             sum(len(tweet.text) for tweet in tweets) / len(tweets) if tweets else None
         )
 
-        return VoiceProfile(
+        # Every field is computed here, so skip re-validation
+        return VoiceProfile.model_construct(
             username=username,
             writing_style=writing_style or "Analyzed from tweets",
             tone=tone or "Analyzed from tweets",
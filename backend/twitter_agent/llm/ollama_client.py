@@ -1,11 +1,126 @@
 """Ollama client for local LLM integration."""
 
+import asyncio
+import gzip
+import json
 import os
+import re
+import time
 from typing import Optional
 
 import httpx
 from loguru import logger
 
+# System prompts are module constants so every request sends byte-identical
+# instructions, which keeps Ollama's prompt prefix cache warm across calls.
+VOICE_ANALYSIS_SYSTEM_PROMPT = """You are an expert at analyzing natural speech patterns and conversational styles. 
+Analyze the given Twitter tweets and provide a comprehensive analysis of how the user naturally expresses themselves, 
+including their conversational style, natural speech patterns, sentence flow, and authentic voice."""
+
+TOPIC_EXTRACTION_SYSTEM_PROMPT = """You are an expert at analyzing social media content and extracting comprehensive topic summaries.
+Your task is to generate a 5-sentence summary that:
+1. Identifies the main topic or subject clearly
+2. Captures the key context and background
+3. Highlights important implications or angles
+4. Identifies discussion points or controversies
+5. Suggests research directions or related aspects
+
+Write in clear, concise sentences. Each sentence should add distinct value.
+Return ONLY the 5-sentence summary, no explanations or labels."""
+
+REPLY_SYSTEM_PROMPT = """You are replicating a Twitter user's authentic voice and natural way of speaking.
+Your task is to craft responses that sound EXACTLY like they wrote them - natural, conversational, like their actual thoughts.
+
+CRITICAL VOICE REPLICATION RULES:
+- Match their capitalization style EXACTLY (lowercase, sentence case, etc.)
+- Use their natural vocabulary, sentence structure, and phrasing patterns from their actual tweets
+- Match their conversational tone - how they naturally express thoughts (casual, thoughtful, witty, etc.)
+- Use their punctuation style - observe if they use periods, line breaks, question marks, etc.
+- NO hashtags unless they frequently use them
+- NO @mentions unless essential
+- Sound NATURAL and HUMAN - like a real person thinking out loud, not polished writing
+- Capture their natural speech patterns, rhythm, and flow
+
+ABSOLUTE PROHIBITIONS:
+- NEVER rephrase, restate, or paraphrase the original tweet
+- NEVER use similar analogies or examples from the original tweet
+- NEVER sound formal, academic, or overly polished
+- NEVER sound like a parrot repeating or rephrasing
+- NEVER write like an essay or article - write like a natural tweet/thought
+
+REQUIREMENTS FOR NATURAL, VALUE-ADDED CONTENT:
+- Stay on the SAME topic but explore different facets with your unique perspective
+- Use researched context naturally - weave it in like you're sharing knowledge, not citing sources
+- Sound like natural conversation or spontaneous thought - authentic, not crafted
+- Match their way of expressing ideas - observe how they structure thoughts in their tweets
+- Be genuine and authentic - like you're responding naturally to what you read
+- Add value through your unique take or insight, but express it naturally"""
+
+STANDALONE_SYSTEM_PROMPT = """You are an expert at replicating a Twitter user's authentic voice and writing style.
+Your task is to generate tweets that match the user's established tone, style, vocabulary, and communication patterns EXACTLY.
+CRITICAL RULES:
+- Write ONLY the tweet text itself - no explanations, no introductions, no meta-commentary
+- Match the user's capitalization style (observe if they use lowercase, sentence case, etc.)
+- Do NOT include hashtags (#) unless the user frequently uses them
+- Do NOT include @mentions unless they are essential to the tweet content
+- The tweet should sound like the user wrote it themselves
+- Stay true to their voice, tone, and writing patterns"""
+
+
+# Lowercased lead-ins stripped from each line of a generated thread (applied in order)
+THREAD_LINE_PREFIXES = ("here's a", "tweet", "generated", "here is")
+
+# Lowercased lead-ins that mark a single tweet as wrapped in commentary
+TWEET_PREFIXES = (
+    "here's a generated tweet in the style of",
+    "here's a tweet",
+    "based on the analysis",
+    "here's a suggested tweet",
+    "a tweet in their style:",
+    "tweet:",
+    "generated tweet:",
+    "suggested tweet:",
+    "here's",
+)
+
+# Phrases that mark a short line as meta-commentary rather than tweet content.
+# Compiled into one alternation so each line is scanned once for all phrases.
+EXPLANATORY_PHRASES = (
+    "here's",
+    "here is",
+    "based on",
+    "suggested",
+    "generated",
+    "in the style",
+    "following the",
+    "matching the",
+    "style of",
+)
+EXPLANATORY_PHRASE_RE = re.compile(
+    "|".join(re.escape(phrase) for phrase in EXPLANATORY_PHRASES), re.IGNORECASE
+)
+
+
+# Lowercased markers of a model refusing to produce the requested content
+REFUSAL_INDICATORS = (
+    "i can't assist",
+    "i cannot assist",
+    "i'm not able",
+    "i cannot help",
+    "i'm not designed",
+    "as an ai",
+    "i apologize, but",
+    "i'm unable to",
+)
+REFUSAL_RE = re.compile(
+    "|".join(re.escape(indicator) for indicator in REFUSAL_INDICATORS), re.IGNORECASE
+)
+
+
+# Monotonic timestamps of successful availability checks, keyed by (base_url, model).
+# Shared across clients because a new client is created for every request.
+_availability_cache: dict[tuple[str, str], float] = {}
+
 
 class OllamaError(Exception):
     """Custom exception for Ollama errors."""
@@ -16,6 +131,12 @@ class OllamaError(Exception):
 class OllamaClient:
     """Client for interacting with Ollama local LLM."""
 
+    # Request bodies larger than this are gzip-compressed when talking to Ollama Cloud
+    COMPRESSION_THRESHOLD_BYTES = 4096
+
+    # How long a successful availability check is trusted before re-checking
+    AVAILABILITY_CACHE_TTL_SECONDS = 30.0
+
     def __init__(self, base_url: Optional[str] = None, model: Optional[str] = None):
         """
         Initialize Ollama client.
@@ -29,6 +150,9 @@ class OllamaClient:
         )
         self.model = model or os.getenv("OLLAMA_MODEL", "llama3.2")
 
+        # Large prompts only benefit from compression over the WAN, not on loopback
+        self.is_cloud = "ollama.com" in self.base_url
+
         # Setup headers for Ollama Cloud authentication
         headers = {}
         api_key = os.getenv("OLLAMA_API_KEY")
@@ -38,10 +162,31 @@ class OllamaClient:
         ):
             headers["Authorization"] = f"Bearer {api_key}"
 
+        # Keep a small pool of warm connections so repeated calls skip TCP/TLS setup
         self.client = httpx.Client(
-            base_url=self.base_url, timeout=300.0, headers=headers
+            base_url=self.base_url,
+            timeout=300.0,
+            headers=headers,
+            limits=httpx.Limits(max_keepalive_connections=4, keepalive_expiry=30.0),
         )
 
+    def _encode_payload(self, payload: dict) -> tuple[bytes, dict[str, str]]:
+        """
+        Serialize a JSON payload, compressing it for Ollama Cloud when large.
+
+        Args:
+            payload: Request payload
+
+        Returns:
+            Tuple of (request body, request headers)
+        """
+        body = json.dumps(payload).encode("utf-8")
+        headers = {"Content-Type": "application/json"}
+        if self.is_cloud and len(body) > self.COMPRESSION_THRESHOLD_BYTES:
+            body = gzip.compress(body, compresslevel=1)
+            headers["Content-Encoding"] = "gzip"
+        return body, headers
+
     def generate(
         self,
         prompt: str,
@@ -82,40 +227,47 @@ class OllamaClient:
             }
             if system:
                 payload["system"] = system
+            body, headers = self._encode_payload(payload)
 
             if stream:
                 # Handle streaming response
                 logger.debug("Using streaming mode for generation")
-                response = self.client.post("/api/generate", json=payload, stream=True)
-                response.raise_for_status()
-                full_text = ""
-                for line in response.iter_lines():
-                    if line:
-                        import json
-
+                parts: list[str] = []
+                with self.client.stream(
+                    "POST", "/api/generate", content=body, headers=headers
+                ) as response:
+                    response.raise_for_status()
+                    for line in response.iter_lines():
+                        if not line:
+                            continue
                         try:
                             chunk = json.loads(line)
-                            if "response" in chunk:
-                                full_text += chunk["response"]
-                            if chunk.get("done", False):
-                                break
                         except json.JSONDecodeError:
                             continue
+                        if "response" in chunk:
+                            parts.append(chunk["response"])
+                        if chunk.get("done", False):
+                            break
+                full_text = "".join(parts)
                 logger.debug(f"Generated {len(full_text)} characters via streaming")
                 return full_text
             else:
-                response = self.client.post("/api/generate", json=payload)
+                response = self.client.post(
+                    "/api/generate", content=body, headers=headers
+                )
                 response.raise_for_status()
                 data = response.json()
                 result = data.get("response", "")
                 logger.debug(f"Generated {len(result)} characters")
                 return result
         except httpx.HTTPStatusError as e:
+            _availability_cache.pop((self.base_url, self.model), None)
             logger.error(f"Ollama API HTTP error: {e.response.status_code}")
             logger.error(f"Request URL: {e.request.url}")
             logger.error(f"Response: {e.response.text}")
             raise OllamaError(f"Ollama API HTTP error: {e.response.status_code} - {e.response.text}") from e
         except Exception as e:
+            _availability_cache.pop((self.base_url, self.model), None)
             logger.exception("Unexpected error during Ollama generation")
             raise OllamaError(f"Unexpected error during generation: {str(e)}") from e
 
@@ -143,9 +295,6 @@ class OllamaClient:
                 f"Using {max_tweets_for_analysis} tweets for analysis (out of {len(tweets)} fetched)"
             )
 
-        system_prompt = """You are an expert at analyzing natural speech patterns and conversational styles. 
-Analyze the given Twitter tweets and provide a comprehensive analysis of how the user naturally expresses themselves, 
-including their conversational style, natural speech patterns, sentence flow, and authentic voice."""
         user_prompt = f"""Analyze how user @{username} naturally writes and speaks based on these tweets:
 
 {tweets_text}
@@ -165,7 +314,7 @@ Format your response as a structured analysis."""
 
         result = self.generate(
             prompt=user_prompt,
-            system=system_prompt,
+            system=VOICE_ANALYSIS_SYSTEM_PROMPT,
             temperature=0.3,  # Lower temperature for more consistent analysis
         )
         logger.debug(f"Voice analysis completed for @{username}")
@@ -227,17 +376,6 @@ Format your response as a structured analysis."""
         """
         logger.info(f"Extracting topic summary from content: {tweet_text[:100]}...")
 
-        system_prompt = """You are an expert at analyzing social media content and extracting comprehensive topic summaries.
-Your task is to generate a 5-sentence summary that:
-1. Identifies the main topic or subject clearly
-2. Captures the key context and background
-3. Highlights important implications or angles
-4. Identifies discussion points or controversies
-5. Suggests research directions or related aspects
-
-Write in clear, concise sentences. Each sentence should add distinct value.
-Return ONLY the 5-sentence summary, no explanations or labels."""
-
         user_prompt = f"""Analyze this content and generate a comprehensive 5-sentence summary:
 
 {tweet_text}
@@ -253,7 +391,7 @@ Write exactly 5 sentences. Each sentence should be substantial and informative:"
 
         result = self.generate(
             prompt=user_prompt,
-            system=system_prompt,
+            system=TOPIC_EXTRACTION_SYSTEM_PROMPT,
             temperature=0.4,  # Slightly higher for more nuanced summary
         )
 
@@ -284,6 +422,30 @@ Write exactly 5 sentences. Each sentence should be substantial and informative:"
         )
         return summary
 
+    async def prepare_context(
+        self, tweets: list[str], username: str, content_text: str
+    ) -> tuple[str, str]:
+        """
+        Run voice analysis and topic extraction concurrently.
+
+        The two LLM calls are independent, so pre-generation latency becomes the
+        longer of the two instead of their sum. Each call runs in a worker thread
+        because the underlying HTTP client is synchronous.
+
+        Args:
+            tweets: List of tweet texts to analyze
+            username: Twitter username
+            content_text: Tweet, thread, or article content to summarize
+
+        Returns:
+            Tuple of (voice analysis, topic summary)
+        """
+        voice_analysis, topic_summary = await asyncio.gather(
+            asyncio.to_thread(self.analyze_voice, tweets, username),
+            asyncio.to_thread(self.extract_topic, content_text),
+        )
+        return voice_analysis, topic_summary
+
     def generate_content(
         self,
         voice_analysis: str,
@@ -317,43 +479,9 @@ Write exactly 5 sentences. Each sentence should be substantial and informative:"
         """
         # Enhanced system prompt for replies/quotes vs standalone tweets
         if original_tweet_context:
-            system_prompt = """You are replicating a Twitter user's authentic voice and natural way of speaking.
-Your task is to craft responses that sound EXACTLY like they wrote them - natural, conversational, like their actual thoughts.
-
-CRITICAL VOICE REPLICATION RULES:
-- Match their capitalization style EXACTLY (lowercase, sentence case, etc.)
-- Use their natural vocabulary, sentence structure, and phrasing patterns from their actual tweets
-- Match their conversational tone - how they naturally express thoughts (casual, thoughtful, witty, etc.)
-- Use their punctuation style - observe if they use periods, line breaks, question marks, etc.
-- NO hashtags unless they frequently use them
-- NO @mentions unless essential
-- Sound NATURAL and HUMAN - like a real person thinking out loud, not polished writing
-- Capture their natural speech patterns, rhythm, and flow
-
-ABSOLUTE PROHIBITIONS:
-- NEVER rephrase, restate, or paraphrase the original tweet
-- NEVER use similar analogies or examples from the original tweet
-- NEVER sound formal, academic, or overly polished
-- NEVER sound like a parrot repeating or rephrasing
-- NEVER write like an essay or article - write like a natural tweet/thought
-
-REQUIREMENTS FOR NATURAL, VALUE-ADDED CONTENT:
-- Stay on the SAME topic but explore different facets with your unique perspective
-- Use researched context naturally - weave it in like you're sharing knowledge, not citing sources
-- Sound like natural conversation or spontaneous thought - authentic, not crafted
-- Match their way of expressing ideas - observe how they structure thoughts in their tweets
-- Be genuine and authentic - like you're responding naturally to what you read
-- Add value through your unique take or insight, but express it naturally"""
+            system_prompt = REPLY_SYSTEM_PROMPT
         else:
-            system_prompt = """You are an expert at replicating a Twitter user's authentic voice and writing style.
-Your task is to generate tweets that match the user's established tone, style, vocabulary, and communication patterns EXACTLY.
-CRITICAL RULES:
-- Write ONLY the tweet text itself - no explanations, no introductions, no meta-commentary
-- Match the user's capitalization style (observe if they use lowercase, sentence case, etc.)
-- Do NOT include hashtags (#) unless the user frequently uses them
-- Do NOT include @mentions unless they are essential to the tweet content
-- The tweet should sound like the user wrote it themselves
-- Stay true to their voice, tone, and writing patterns"""
+            system_prompt = STANDALONE_SYSTEM_PROMPT
 
         context_parts = []
         if original_tweet_context:
@@ -579,8 +707,8 @@ Write the tweet now (ONLY the tweet text, nothing else):"""
                 if not line:
                     continue
                 # Remove common prefixes from each line
-                for prefix in ["Here's a", "Tweet", "Generated", "Here is"]:
-                    if line.lower().startswith(prefix.lower()):
+                for prefix in THREAD_LINE_PREFIXES:
+                    if line.lower().startswith(prefix):
                         line = line[len(prefix) :].strip()
                         if line.startswith(":") or line.startswith("-"):
                             line = line[1:].strip()
@@ -589,25 +717,11 @@ Write the tweet now (ONLY the tweet text, nothing else):"""
         else:
             # For single tweets, clean as before
             # Remove common prefixes and explanatory text
-            prefixes_to_remove = [
-                "Here's a generated tweet in the style of",
-                "Here's a tweet",
-                "Based on the analysis",
-                "Here's a suggested tweet",
-                "A tweet in their style:",
-                "Tweet:",
-                "Generated tweet:",
-                "Suggested tweet:",
-                "Here's",
-            ]
-
-            for prefix in prefixes_to_remove:
-                if result.lower().startswith(prefix.lower()):
-                    # Find the colon or newline and take everything after
-                    colon_idx = result.find(":")
-                    if colon_idx != -1:
-                        result = result[colon_idx + 1 :].strip()
-                    break
+            if result.lower().startswith(TWEET_PREFIXES):
+                # Find the colon or newline and take everything after
+                colon_idx = result.find(":")
+                if colon_idx != -1:
+                    result = result[colon_idx + 1 :].strip()
 
             # Remove quotes if the entire result is quoted
             if result.startswith('"') and result.endswith('"'):
@@ -616,61 +730,30 @@ Write the tweet now (ONLY the tweet text, nothing else):"""
                 result = result[1:-1].strip()
 
             # Remove leading/trailing explanatory phrases
-            lines = result.split("\n")
-            cleaned_lines = []
-            for line in lines:
-                line = line.strip()
-                if not line:
-                    continue
-                # Skip lines that are clearly explanatory (short lines with explanatory phrases)
-                if (
-                    any(
-                        phrase in line.lower()
-                        for phrase in [
-                            "here's",
-                            "here is",
-                            "based on",
-                            "suggested",
-                            "generated",
-                            "in the style",
-                            "following the",
-                            "matching the",
-                            "style of",
-                        ]
-                    )
-                    and len(line) < 100
-                ):
-                    continue
-                cleaned_lines.append(line)
-
-            if cleaned_lines:
-                result = " ".join(cleaned_lines)
+            # Skip lines that are clearly explanatory (short lines with explanatory phrases).
+            # A single-line result is left as-is either way, so only multi-line output is scanned.
+            if "\n" in result:
+                stripped_lines = (line.strip() for line in result.split("\n"))
+                cleaned = " ".join(
+                    line
+                    for line in stripped_lines
+                    if line
+                    and not (len(line) < 100 and EXPLANATORY_PHRASE_RE.search(line))
+                )
+                if cleaned:
+                    result = cleaned
 
         # Check for refusal patterns and try to extract actual content
-        refusal_indicators = [
-            "I can't assist",
-            "I cannot assist",
-            "I'm not able",
-            "I cannot help",
-            "I'm not designed",
-            "as an AI",
-            "I apologize, but",
-            "I'm unable to",
-        ]
-
-        if any(indicator.lower() in result.lower() for indicator in refusal_indicators):
+        if REFUSAL_RE.search(result):
             logger.warning(
                 "LLM refused to generate content - response appears to be a refusal"
             )
             logger.debug(f"Refused response: {result[:200]}")
             # Try to extract any actual content if present
-            lines = result.split("\n")
             content_lines = [
                 line
-                for line in lines
-                if not any(ind.lower() in line.lower() for ind in refusal_indicators)
-                and line.strip()
-                and len(line.strip()) > 10
+                for line in result.splitlines()
+                if len(line.strip()) > 10 and not REFUSAL_RE.search(line)
             ]
             if content_lines:
                 result = " ".join(content_lines)
@@ -690,20 +773,32 @@ Write the tweet now (ONLY the tweet text, nothing else):"""
         Returns:
             True if Ollama is accessible, False otherwise
         """
+        cache_key = (self.base_url, self.model)
+        checked_at = _availability_cache.get(cache_key)
+        if (
+            checked_at is not None
+            and time.monotonic() - checked_at < self.AVAILABILITY_CACHE_TTL_SECONDS
+        ):
+            logger.debug(f"Model {self.model} availability served from cache")
+            return True
+
         try:
             logger.debug(f"Checking Ollama availability at {self.base_url}")
             response = self.client.get("/api/tags")
             response.raise_for_status()
             data = response.json()
-            models = [model.get("name", "") for model in data.get("models", [])]
             # Check if default model is available (with or without tag)
+            base_model = self.model.split(":", 1)[0]
             model_available = any(
-                self.model in model or model.startswith(self.model.split(":")[0])
-                for model in models
+                self.model in (name := model.get("name", ""))
+                or name.startswith(base_model)
+                for model in data.get("models", [])
             )
             if model_available:
                 logger.debug(f"Model {self.model} is available")
+                _availability_cache[cache_key] = time.monotonic()
             else:
+                models = [model.get("name", "") for model in data.get("models", [])]
                 logger.warning(
                     f"Model {self.model} not found in available models: {models}"
                 )
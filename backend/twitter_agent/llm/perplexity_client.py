@@ -1,7 +1,13 @@
 """Perplexity API client for fetching topic information using the official SDK."""
 
+import asyncio
+import hashlib
 import os
+import threading
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
+from types import MappingProxyType
 from typing import Callable, Optional
 
 from loguru import logger
@@ -29,6 +35,12 @@ except ImportError:
     RateLimitError = Exception
 
 
+# Research results shared across client instances (clients are created per request).
+# Maps cache key -> (stored_at, content); ordered from least to most recently used.
+_research_cache: OrderedDict[str, tuple[float, str]] = OrderedDict()
+_research_cache_lock = threading.Lock()
+
+
 class PerplexityError(Exception):
     """Custom exception for Perplexity API errors."""
 
@@ -62,9 +74,14 @@ class PerplexityClient:
     DEFAULT_TEMPERATURE = 0.3
     DEFAULT_SEARCH_RECENCY = "month"
 
+    # Research result cache settings
+    RESEARCH_CACHE_MAX_ENTRIES = 256
+    RESEARCH_CACHE_TTL_SECONDS = 6 * 3600
+
     # Content detection thresholds
     FULL_CONTENT_MIN_LENGTH = 500
     FULL_CONTENT_MARKER = "\n\n"
+    FULL_CONTENT_MARKER_MIN_LENGTH = 100
 
     # System prompt for research assistant
     SYSTEM_PROMPT = (
@@ -94,12 +111,93 @@ class PerplexityClient:
         "5. Any cultural or industry context that's relevant"
     )
 
-    # Perspective guidance mapping
-    PERSPECTIVE_GUIDANCE = {
-        "analytical": "\nFocus on analytical depth, implications, and deeper insights. Provide structured analysis.",
-        "current": "\nFocus on recent developments, current trends, and real-time information. Emphasize what's happening now.",
+    # Perspective guidance mapping (read-only; shared by every client)
+    PERSPECTIVE_GUIDANCE = MappingProxyType(
+        {
+            "analytical": "\nFocus on analytical depth, implications, and deeper insights. Provide structured analysis.",
+            "current": "\nFocus on recent developments, current trends, and real-time information. Emphasize what's happening now.",
+        }
+    )
+
+    # (log message, error message) templates for API errors, keyed by category
+    ERROR_TEMPLATES = {
+        "rate_limit": (
+            "Perplexity API rate limit exceeded: {error_msg}",
+            "Rate limit exceeded. Please retry later: {error_msg}",
+        ),
+        "bad_request": (
+            "Perplexity API bad request: {error_msg}",
+            "Invalid request parameters: {error_msg}",
+        ),
+        "api": (
+            "Perplexity API error ({status_code}): {error_msg}",
+            "Perplexity API error ({status_code}): {error_msg}",
+        ),
     }
 
+    # Prompt templates with the static requirement text already interpolated;
+    # only the per-request fields are filled in with str.format().
+    DEEP_RESEARCH_CONTENT_PROMPT = f"""Conduct comprehensive research based on this content:
+
+{{topic}}
+
+Analyze this content thoroughly and provide exhaustive research that includes:
+{RESEARCH_REQUIREMENTS_DEEP}
+
+CRITICAL: Stay focused on the topics and themes present in the content above - explore different facets, implications, and perspectives WITHIN these topic areas, not unrelated topics.
+
+Format as comprehensive research (8-12 sentences) that enables crafting distinctive, value-added social media content with deep context."""
+
+    DEEP_RESEARCH_TOPIC_PROMPT = f"""Conduct comprehensive research on: "{{topic}}"
+
+Provide exhaustive research that includes:
+{RESEARCH_REQUIREMENTS_DEEP}
+
+CRITICAL: Stay focused on "{{topic}}" - explore different facets, implications, and perspectives WITHIN this topic area, not unrelated topics.
+
+Format as comprehensive research (8-12 sentences) that enables crafting distinctive, value-added social media content with deep context."""
+
+    SYNTHESIS_PROMPT = """Analyze and synthesize this comprehensive research about "{topic}" for social media content creation:
+
+{research_content}
+
+Provide a focused, nuanced summary (5-8 sentences) that:
+- Extracts the most relevant insights for engaging social media content
+- Highlights different perspectives and angles
+- Identifies discussion-worthy points and implications
+- Presents information in a way that enables crafting unique, value-added responses
+- Maintains focus on the core topic while providing depth
+
+Format as rich context suitable for generating engaging Twitter content."""
+
+    RESEARCH_REPLY_PROMPT = f"""Research this topic: "{{topic}}"
+
+Original tweet says: "{{original_tweet_text}}"
+
+Provide rich context about THIS SPECIFIC TOPIC that helps craft a UNIQUE Twitter response. Stay on the same topic but provide:
+- Different angles, nuances, or deeper insights about the SAME topic
+- Additional context, examples, or implications within this topic area
+- Related aspects or perspectives on this topic that weren't mentioned
+- Recent developments or debates specifically about this topic
+
+CRITICAL: Stay focused on "{{topic}}" - do not branch into unrelated topics. Explore different facets, implications, or perspectives WITHIN this topic area.
+
+Include:
+{RESEARCH_REQUIREMENTS_STANDARD}
+{{perspective_guidance}}
+
+IMPORTANT: Provide deeper context about this specific topic to enable unique responses that add value while staying on-topic.
+
+Format as rich context (3-5 sentences) about this topic that enables crafting distinctive, value-added responses."""
+
+    RESEARCH_PROMPT = f"""Research this topic: "{{topic}}"
+
+Provide comprehensive context that would help someone craft an engaging Twitter post about this topic. Include:
+{RESEARCH_REQUIREMENTS_STANDARD}
+{{perspective_guidance}}
+
+Format your response as rich context (3-5 sentences) that captures the essence and interesting aspects of this topic."""
+
     def __init__(self, api_key: Optional[str] = None):
         """
         Initialize Perplexity API client.
@@ -114,6 +212,8 @@ class PerplexityClient:
         self._validate_sdk_available()
         self.api_key = self._get_api_key(api_key)
         self.client = Perplexity(api_key=self.api_key)
+        # The system message never changes, so build it once and reuse it per call
+        self._system_message = {"role": "system", "content": self.SYSTEM_PROMPT}
 
     @staticmethod
     def _validate_sdk_available() -> None:
@@ -249,6 +349,56 @@ class PerplexityClient:
         except Exception as e:
             self._handle_error(e)
 
+    async def search_topic_async(self, topic: str, **kwargs) -> str:
+        """
+        Async variant of search_topic.
+
+        The SDK call runs in a worker thread so several topics can be researched
+        concurrently from an event loop.
+
+        Args:
+            topic: Topic or query to research
+            **kwargs: Keyword arguments accepted by search_topic
+
+        Returns:
+            Rich context text about the topic
+        """
+        return await asyncio.to_thread(self.search_topic, topic, **kwargs)
+
+    async def deep_research_topic_async(self, topic: str, **kwargs) -> str:
+        """
+        Async variant of deep_research_topic.
+
+        The research and synthesis steps stay sequential for a single topic;
+        concurrency comes from researching several topics at once.
+
+        Args:
+            topic: Topic or query to research
+            **kwargs: Keyword arguments accepted by deep_research_topic
+
+        Returns:
+            Comprehensive research text
+        """
+        return await asyncio.to_thread(self.deep_research_topic, topic, **kwargs)
+
+    async def research_topics(
+        self, topics: list[str], deep_research: bool = False
+    ) -> list[str]:
+        """
+        Research several topics concurrently.
+
+        Args:
+            topics: Topics to research
+            deep_research: Use deep research instead of standard search
+
+        Returns:
+            Research text for each topic, in the same order as topics
+        """
+        research = (
+            self.deep_research_topic_async if deep_research else self.search_topic_async
+        )
+        return list(await asyncio.gather(*(research(topic) for topic in topics)))
+
     def _execute_research(
         self,
         config: ResearchConfig,
@@ -269,6 +419,12 @@ class PerplexityClient:
         Raises:
             PerplexityError: If API request fails
         """
+        cache_key = self._research_cache_key(config, model, prompt_builder)
+        cached = self._get_cached_research(cache_key)
+        if cached is not None:
+            logger.debug(f"Research cache hit for topic: {config.topic[:100]}...")
+            return cached
+
         web_search_options = self._build_web_search_options(
             config.search_recency_filter, config.search_domain_filter
         )
@@ -276,7 +432,75 @@ class PerplexityClient:
         completion = self._call_api(
             research_prompt, model, config.max_tokens, web_search_options
         )
-        return self._extract_content(completion, config.topic)
+        content = self._extract_content(completion, config.topic)
+        if completion.choices:
+            self._store_cached_research(cache_key, content)
+        return content
+
+    @staticmethod
+    def _research_cache_key(
+        config: ResearchConfig,
+        model: str,
+        prompt_builder: Callable[[str, Optional[str]], str],
+    ) -> str:
+        """
+        Build a deterministic cache key for a research request.
+
+        Args:
+            config: Research configuration
+            model: Model used for the research
+            prompt_builder: Function used to build the research prompt
+
+        Returns:
+            Hex digest identifying the request
+        """
+        key_parts = (
+            model,
+            config.max_tokens,
+            config.search_recency_filter,
+            tuple(sorted(config.search_domain_filter or [])),
+            prompt_builder.__name__,
+            config.topic.strip().lower(),
+            config.original_tweet_text,
+        )
+        return hashlib.sha256(repr(key_parts).encode("utf-8")).hexdigest()
+
+    @classmethod
+    def _get_cached_research(cls, cache_key: str) -> Optional[str]:
+        """
+        Get cached research content if present and not expired.
+
+        Args:
+            cache_key: Key from _research_cache_key
+
+        Returns:
+            Cached content or None
+        """
+        with _research_cache_lock:
+            entry = _research_cache.get(cache_key)
+            if entry is None:
+                return None
+            stored_at, content = entry
+            if time.monotonic() - stored_at > cls.RESEARCH_CACHE_TTL_SECONDS:
+                del _research_cache[cache_key]
+                return None
+            _research_cache.move_to_end(cache_key)
+            return content
+
+    @classmethod
+    def _store_cached_research(cls, cache_key: str, content: str) -> None:
+        """
+        Store research content, evicting the least recently used entries.
+
+        Args:
+            cache_key: Key from _research_cache_key
+            content: Research content to cache
+        """
+        with _research_cache_lock:
+            _research_cache[cache_key] = (time.monotonic(), content)
+            _research_cache.move_to_end(cache_key)
+            while len(_research_cache) > cls.RESEARCH_CACHE_MAX_ENTRIES:
+                _research_cache.popitem(last=False)
 
     def _synthesize_for_social_media(
         self, config: ResearchConfig, research_content: str
@@ -371,8 +595,13 @@ class PerplexityClient:
         Returns:
             True if topic appears to be full content, False if summary
         """
+        topic_length = len(topic)
+        if topic_length > cls.FULL_CONTENT_MIN_LENGTH:
+            return True
+        # Short topics can't be full content, so skip scanning them for paragraphs
         return (
-            len(topic) > cls.FULL_CONTENT_MIN_LENGTH or cls.FULL_CONTENT_MARKER in topic
+            topic_length > cls.FULL_CONTENT_MARKER_MIN_LENGTH
+            and cls.FULL_CONTENT_MARKER in topic
         )
 
     @classmethod
@@ -390,30 +619,12 @@ class PerplexityClient:
         Returns:
             Formatted research prompt string optimized for deep research
         """
-        is_full_content = cls._is_full_content(topic)
-
-        if is_full_content:
+        if cls._is_full_content(topic):
             # Topic is full content - treat it as the complete context
-            base_prompt = f"""Conduct comprehensive research based on this content:
-
-{topic}
-
-Analyze this content thoroughly and provide exhaustive research that includes:
-{cls.RESEARCH_REQUIREMENTS_DEEP}
-
-CRITICAL: Stay focused on the topics and themes present in the content above - explore different facets, implications, and perspectives WITHIN these topic areas, not unrelated topics.
-
-Format as comprehensive research (8-12 sentences) that enables crafting distinctive, value-added social media content with deep context."""
+            base_prompt = cls.DEEP_RESEARCH_CONTENT_PROMPT.format(topic=topic)
         else:
             # Topic is a summary - use traditional approach
-            base_prompt = f"""Conduct comprehensive research on: "{topic}"
-
-Provide exhaustive research that includes:
-{cls.RESEARCH_REQUIREMENTS_DEEP}
-
-CRITICAL: Stay focused on "{topic}" - explore different facets, implications, and perspectives WITHIN this topic area, not unrelated topics.
-
-Format as comprehensive research (8-12 sentences) that enables crafting distinctive, value-added social media content with deep context."""
+            base_prompt = cls.DEEP_RESEARCH_TOPIC_PROMPT.format(topic=topic)
 
         if original_tweet_text:
             return f"""{base_prompt}
@@ -434,18 +645,9 @@ Additional context: This research is for crafting a unique Twitter response to t
         Returns:
             Formatted synthesis prompt
         """
-        return f"""Analyze and synthesize this comprehensive research about "{topic}" for social media content creation:
-
-{research_content}
-
-Provide a focused, nuanced summary (5-8 sentences) that:
-- Extracts the most relevant insights for engaging social media content
-- Highlights different perspectives and angles
-- Identifies discussion-worthy points and implications
-- Presents information in a way that enables crafting unique, value-added responses
-- Maintains focus on the core topic while providing depth
-
-Format as rich context suitable for generating engaging Twitter content."""
+        return cls.SYNTHESIS_PROMPT.format(
+            topic=topic, research_content=research_content
+        )
 
     @classmethod
     def _build_research_prompt(
@@ -468,33 +670,15 @@ Format as rich context suitable for generating engaging Twitter content."""
         perspective_guidance = cls._get_perspective_guidance(perspective)
 
         if original_tweet_text:
-            return f"""Research this topic: "{topic}"
-
-Original tweet says: "{original_tweet_text}"
-
-Provide rich context about THIS SPECIFIC TOPIC that helps craft a UNIQUE Twitter response. Stay on the same topic but provide:
-- Different angles, nuances, or deeper insights about the SAME topic
-- Additional context, examples, or implications within this topic area
-- Related aspects or perspectives on this topic that weren't mentioned
-- Recent developments or debates specifically about this topic
-
-CRITICAL: Stay focused on "{topic}" - do not branch into unrelated topics. Explore different facets, implications, or perspectives WITHIN this topic area.
-
-Include:
-{cls.RESEARCH_REQUIREMENTS_STANDARD}
-{perspective_guidance}
-
-IMPORTANT: Provide deeper context about this specific topic to enable unique responses that add value while staying on-topic.
-
-Format as rich context (3-5 sentences) about this topic that enables crafting distinctive, value-added responses."""
-
-        return f"""Research this topic: "{topic}"
-
-Provide comprehensive context that would help someone craft an engaging Twitter post about this topic. Include:
-{cls.RESEARCH_REQUIREMENTS_STANDARD}
-{perspective_guidance}
+            return cls.RESEARCH_REPLY_PROMPT.format(
+                topic=topic,
+                original_tweet_text=original_tweet_text,
+                perspective_guidance=perspective_guidance,
+            )
 
-Format your response as rich context (3-5 sentences) that captures the essence and interesting aspects of this topic."""
+        return cls.RESEARCH_PROMPT.format(
+            topic=topic, perspective_guidance=perspective_guidance
+        )
 
     @classmethod
     def _get_perspective_guidance(cls, perspective: Optional[str]) -> str:
@@ -536,7 +720,7 @@ Format your response as rich context (3-5 sentences) that captures the essence a
 
         return self.client.chat.completions.create(
             messages=[
-                {"role": "system", "content": self.SYSTEM_PROMPT},
+                self._system_message,
                 {"role": "user", "content": research_prompt},
             ],
             model=model,
@@ -582,38 +766,22 @@ Format your response as rich context (3-5 sentences) that captures the essence a
 
         # Check for rate limit errors
         if "rate limit" in error_msg.lower() or error_type == "RateLimitError":
-            self._raise_rate_limit_error(error_msg, error)
+            category = "rate_limit"
         # Check for bad request errors
         elif status_code == 400:
-            self._raise_bad_request_error(error_msg, error)
+            category = "bad_request"
         # Check for other API errors
         elif status_code:
-            self._raise_api_error(status_code, error_msg, error)
+            category = "api"
         # Fallback for unexpected errors
         else:
             logger.exception(f"Unexpected error calling Perplexity API: {error_msg}")
             raise PerplexityError(f"Unexpected error: {error_msg}") from error
 
-    @staticmethod
-    def _raise_rate_limit_error(error_msg: str, error: Exception) -> None:
-        """Raise rate limit error."""
-        logger.error(f"Perplexity API rate limit exceeded: {error_msg}")
-        raise PerplexityError(
-            f"Rate limit exceeded. Please retry later: {error_msg}"
-        ) from error
-
-    @staticmethod
-    def _raise_bad_request_error(error_msg: str, error: Exception) -> None:
-        """Raise bad request error."""
-        logger.error(f"Perplexity API bad request: {error_msg}")
-        raise PerplexityError(f"Invalid request parameters: {error_msg}") from error
-
-    @staticmethod
-    def _raise_api_error(status_code: int, error_msg: str, error: Exception) -> None:
-        """Raise generic API error."""
-        logger.error(f"Perplexity API error ({status_code}): {error_msg}")
+        log_template, error_template = self.ERROR_TEMPLATES[category]
+        logger.error(log_template.format(status_code=status_code, error_msg=error_msg))
         raise PerplexityError(
-            f"Perplexity API error ({status_code}): {error_msg}"
+            error_template.format(status_code=status_code, error_msg=error_msg)
         ) from error
 
     def close(self):
@@ -1,10 +1,10 @@
 """Data models and schemas for Twitter Agent."""
 
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum
 from typing import Any, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class ContentType(str, Enum):
@@ -31,6 +31,8 @@ class UserInfo(BaseModel):
 class Tweet(BaseModel):
     """Tweet data model."""
 
+    model_config = ConfigDict(frozen=True)
+
     tweet_id: str
     text: str
     created_at: Optional[datetime] = None
@@ -47,6 +49,8 @@ class Tweet(BaseModel):
 class VoiceProfile(BaseModel):
     """Analyzed voice/persona profile."""
 
+    model_config = ConfigDict(frozen=True)
+
     username: str
     writing_style: str = Field(description="Description of writing style")
     tone: str = Field(description="Tone characteristics")
@@ -54,12 +58,14 @@ class VoiceProfile(BaseModel):
     hashtag_usage: dict[str, int] = Field(default_factory=dict, description="Frequency of hashtags")
     average_tweet_length: Optional[int] = None
     engagement_patterns: dict[str, Any] = Field(default_factory=dict, description="Engagement patterns")
-    analyzed_at: datetime = Field(default_factory=datetime.now)
+    analyzed_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
 
 class ContentProposal(BaseModel):
     """Generated content proposal."""
 
+    model_config = ConfigDict(frozen=True)
+
     content_type: ContentType
     content: str | list[str] = Field(description="Tweet text or list of tweets for thread")
     suggested_date: Optional[datetime] = None
@@ -86,6 +92,8 @@ class ContentProposal(BaseModel):
 class CalendarEvent(BaseModel):
     """Calendar event for scheduling."""
 
+    model_config = ConfigDict(frozen=True)
+
     date: datetime
     title: Optional[str] = None
     description: Optional[str] = None
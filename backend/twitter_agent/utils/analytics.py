@@ -1,11 +1,18 @@
 """Analytics processor for engagement patterns and content insights."""
 
-from collections import Counter, defaultdict
+import copy
+import heapq
+import re
+from collections import Counter
 from datetime import datetime, timedelta
+from functools import cached_property
 from typing import Optional
 
 from twitter_agent.models.schemas import Tweet
 
+# Hashtags end at the first non-word character, so "#ai." counts as "#ai"
+_HASHTAG_RE = re.compile(r"#\w+")
+
 
 class AnalyticsProcessor:
     """Process engagement analytics from tweets."""
@@ -23,75 +30,91 @@ class AnalyticsProcessor:
         """
         Analyze engagement patterns from tweets.
 
+        The analysis is computed on first use and reused by later calls,
+        including get_insights_summary, so the tweets are only walked once per
+        processor.
+
         Returns:
-            Dictionary with engagement insights
+            Dictionary with engagement insights. Each call returns a fresh copy,
+            so callers may modify it without affecting the cached analysis.
         """
+        return copy.deepcopy(self._engagement_patterns)
+
+    @cached_property
+    def _engagement_patterns(self) -> dict[str, any]:
+        """Compute engagement patterns in a single pass over the tweets."""
         if not self.tweets:
             return {}
 
-        # Calculate average engagement metrics
-        total_likes = sum(t.like_count or 0 for t in self.tweets)
-        total_retweets = sum(t.retweet_count or 0 for t in self.tweets)
-        total_replies = sum(t.reply_count or 0 for t in self.tweets)
-        total_quotes = sum(t.quote_count or 0 for t in self.tweets)
-
-        avg_likes = total_likes / len(self.tweets) if self.tweets else 0
-        avg_retweets = total_retweets / len(self.tweets) if self.tweets else 0
-        avg_replies = total_replies / len(self.tweets) if self.tweets else 0
-        avg_quotes = total_quotes / len(self.tweets) if self.tweets else 0
-
-        # Find top performing tweets
-        top_tweets = sorted(
-            self.tweets,
-            key=lambda t: (t.like_count or 0) + (t.retweet_count or 0) * 2,
-            reverse=True,
-        )[:10]
-
-        # Analyze best posting times
-        hourly_engagement = defaultdict(lambda: {"likes": 0, "retweets": 0, "count": 0})
-        for tweet in self.tweets:
+        total_likes = total_retweets = total_replies = total_quotes = 0
+        total_length = 0
+        reply_engagement = reply_count = 0
+        original_engagement = original_count = 0
+        top_heap: list[tuple[int, int]] = []
+        hour_likes = [0] * 24
+        hour_retweets = [0] * 24
+        hour_counts = [0] * 24
+        hashtag_counts = Counter()
+
+        # Bind hot-loop callables locally to skip attribute lookups per tweet
+        find_hashtags = _HASHTAG_RE.findall
+        count_hashtags = hashtag_counts.update
+        heappush = heapq.heappush
+        heappushpop = heapq.heappushpop
+
+        # Single pass over the tweets accumulating every aggregate at once
+        for index, tweet in enumerate(self.tweets):
+            likes = tweet.like_count or 0
+            retweets = tweet.retweet_count or 0
+            total_likes += likes
+            total_retweets += retweets
+            total_replies += tweet.reply_count or 0
+            total_quotes += tweet.quote_count or 0
+            total_length += len(tweet.text)
+
+            # Keep the 10 best tweets; negated index makes earlier tweets win ties
+            entry = (likes + retweets * 2, -index)
+            if len(top_heap) < 10:
+                heappush(top_heap, entry)
+            else:
+                heappushpop(top_heap, entry)
+
             if tweet.created_at:
                 hour = tweet.created_at.hour
-                hourly_engagement[hour]["likes"] += tweet.like_count or 0
-                hourly_engagement[hour]["retweets"] += tweet.retweet_count or 0
-                hourly_engagement[hour]["count"] += 1
-
-        # Find best hours
-        best_hours = sorted(
-            hourly_engagement.items(),
-            key=lambda x: (x[1]["likes"] + x[1]["retweets"] * 2) / max(x[1]["count"], 1),
-            reverse=True,
-        )[:3]
+                hour_likes[hour] += likes
+                hour_retweets[hour] += retweets
+                hour_counts[hour] += 1
 
-        # Analyze content length
-        tweet_lengths = [len(t.text) for t in self.tweets]
-        avg_length = sum(tweet_lengths) / len(tweet_lengths) if tweet_lengths else 0
+            count_hashtags(tag.lower() for tag in find_hashtags(tweet.text))
 
-        # Analyze hashtag usage
-        hashtag_counts = Counter()
-        for tweet in self.tweets:
-            words = tweet.text.split()
-            for word in words:
-                if word.startswith("#"):
-                    hashtag_counts[word.lower()] += 1
+            if tweet.is_reply:
+                reply_engagement += likes + retweets
+                reply_count += 1
+            else:
+                original_engagement += likes + retweets
+                original_count += 1
 
-        top_hashtags = [tag for tag, count in hashtag_counts.most_common(10)]
+        tweet_count = len(self.tweets)
+        avg_likes = total_likes / tweet_count
+        avg_retweets = total_retweets / tweet_count
+        avg_replies = total_replies / tweet_count
+        avg_quotes = total_quotes / tweet_count
+        avg_length = total_length / tweet_count
 
-        # Analyze reply vs original tweets
-        reply_tweets = [t for t in self.tweets if t.is_reply]
-        original_tweets = [t for t in self.tweets if not t.is_reply]
+        top_tweets = [self.tweets[-index] for _, index in sorted(top_heap, reverse=True)]
 
-        reply_avg_engagement = (
-            sum((t.like_count or 0) + (t.retweet_count or 0) for t in reply_tweets)
-            / len(reply_tweets)
-            if reply_tweets
-            else 0
+        # Find best hours
+        best_hours = heapq.nlargest(
+            3,
+            (hour for hour in range(24) if hour_counts[hour]),
+            key=lambda h: (hour_likes[h] + hour_retweets[h] * 2) / hour_counts[h],
         )
+
+        top_hashtags = [tag for tag, count in hashtag_counts.most_common(10)]
+
+        reply_avg_engagement = reply_engagement / reply_count if reply_count else 0
         original_avg_engagement = (
-            sum((t.like_count or 0) + (t.retweet_count or 0) for t in original_tweets)
-            / len(original_tweets)
-            if original_tweets
-            else 0
+            original_engagement / original_count if original_count else 0
         )
 
         return {
@@ -109,7 +132,7 @@ class AnalyticsProcessor:
                 }
                 for t in top_tweets[:5]
             ],
-            "best_posting_hours": [hour for hour, _ in best_hours],
+            "best_posting_hours": best_hours,
             "average_tweet_length": round(avg_length, 0),
             "top_hashtags": top_hashtags,
             "engagement_by_type": {
@@ -126,7 +149,8 @@ class AnalyticsProcessor:
         Returns:
             Formatted string with insights
         """
-        patterns = self.analyze_engagement_patterns()
+        # Read-only use, so skip the defensive copy the public method makes
+        patterns = self._engagement_patterns
         if not patterns:
             return "No analytics data available."
 
@@ -1,24 +1,104 @@
 """Utility for extracting article content from URLs."""
 
+import asyncio
 import re
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 from urllib.parse import urlparse
 
 import httpx
 from loguru import logger
 
+try:
+    from lxml import etree, html
+
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
 try:
     from readability import Readability
-    from lxml import html
 
-    READABILITY_AVAILABLE = True
+    READABILITY_AVAILABLE = LXML_AVAILABLE
 except ImportError:
     READABILITY_AVAILABLE = False
 
+# Common article/blog path fragments
+_ARTICLE_INDICATORS = (
+    "/article/",
+    "/post/",
+    "/blog/",
+    "/news/",
+    "/story/",
+    "/2024/",
+    "/2025/",
+    "/p/",  # Medium posts
+    ".html",
+    ".htm",
+)
+
+# Social media and other non-article domains; subdomains are excluded as well
+_EXCLUDED_DOMAINS = frozenset(
+    {
+        "twitter.com",
+        "x.com",
+        "youtube.com",
+        "youtu.be",
+        "instagram.com",
+        "tiktok.com",
+        "linkedin.com",
+        "facebook.com",
+        "reddit.com",
+        "github.com",
+    }
+)
+
+# A URL runs to the next whitespace but never ends in punctuation such as ".,;:!?)"
+_URL_RE = re.compile(r"https?://\S*[^\s.,;:!?)]")
+_DATE_PATH_RE = re.compile(r"/\d{4}[/-]\d{1,2}[/-]\d{1,2}/")
+_SCRIPT_RE = re.compile(r"<script[^>]*>.*?</script>", re.DOTALL | re.IGNORECASE)
+_STYLE_RE = re.compile(r"<style[^>]*>.*?</style>", re.DOTALL | re.IGNORECASE)
+_BODY_RE = re.compile(r"<body[^>]*>(.*?)</body>", re.DOTALL | re.IGNORECASE)
+_TAG_RE = re.compile(r"<[^>]+>")
+_WS_RE = re.compile(r"\s+")
+
+# Elements that usually hold the whole article on their own, tried in order
+_MAIN_CONTENT_XPATHS = (
+    "//article",
+    "//main",
+    "//*[@role='main']",
+    "//*[contains(concat(' ', normalize-space(@class), ' '), ' post-content ')]",
+    "//*[contains(concat(' ', normalize-space(@class), ' '), ' article-body ')]",
+)
+
+# Common article containers, tried in order by the lxml fallback
+_ARTICLE_XPATHS = (
+    "//article",
+    "//main",
+    "//div[contains(@class, 'content')]",
+    "//div[contains(@class, 'article')]",
+    "//div[contains(@class, 'post')]",
+)
+
+# Regex equivalents of _ARTICLE_XPATHS for when lxml is not installed
+_ARTICLE_PATTERNS = tuple(
+    re.compile(pattern, re.DOTALL | re.IGNORECASE)
+    for pattern in (
+        r"<article[^>]*>(.*?)</article>",
+        r"<main[^>]*>(.*?)</main>",
+        r'<div[^>]*class="[^"]*content[^"]*"[^>]*>(.*?)</div>',
+        r'<div[^>]*class="[^"]*article[^"]*"[^>]*>(.*?)</div>',
+        r'<div[^>]*class="[^"]*post[^"]*"[^>]*>(.*?)</div>',
+    )
+)
+
 
 class ArticleExtractor:
     """Extract article content from URLs."""
 
+    # Pages larger than this are skipped rather than downloaded and parsed
+    MAX_CONTENT_BYTES = 2 * 1024 * 1024
+
     def __init__(self, timeout: float = 10.0):
         """
         Initialize article extractor.
@@ -39,16 +119,7 @@ class ArticleExtractor:
         Returns:
             List of URLs found in the text
         """
-        # Pattern to match URLs
-        url_pattern = r"https?://[^\s]+"
-        urls = re.findall(url_pattern, text)
-        # Clean up URLs (remove trailing punctuation that's not part of URL)
-        cleaned_urls = []
-        for url in urls:
-            # Remove trailing punctuation that's likely not part of URL
-            url = url.rstrip(".,;:!?)")
-            cleaned_urls.append(url)
-        return cleaned_urls
+        return _URL_RE.findall(text)
 
     def is_article_url(self, url: str) -> bool:
         """
@@ -63,47 +134,17 @@ class ArticleExtractor:
         parsed = urlparse(url)
         path = parsed.path.lower()
 
-        # Common article/blog patterns
-        article_indicators = [
-            "/article/",
-            "/post/",
-            "/blog/",
-            "/news/",
-            "/story/",
-            "/2024/",
-            "/2025/",
-            "/p/",  # Medium posts
-            ".html",
-            ".htm",
-        ]
-
-        # Exclude social media and common non-article domains
-        excluded_domains = [
-            "twitter.com",
-            "x.com",
-            "youtube.com",
-            "youtu.be",
-            "instagram.com",
-            "tiktok.com",
-            "linkedin.com",
-            "facebook.com",
-            "reddit.com",
-            "github.com",
-        ]
-
-        domain = parsed.netloc.lower()
-
-        # Check if domain is excluded
-        if any(excluded in domain for excluded in excluded_domains):
+        # Exclude social media and common non-article domains, including subdomains
+        labels = (parsed.hostname or "").split(".")
+        if any(".".join(labels[i:]) in _EXCLUDED_DOMAINS for i in range(len(labels))):
             return False
 
         # Check if path suggests an article
-        if any(indicator in path for indicator in article_indicators):
+        if any(indicator in path for indicator in _ARTICLE_INDICATORS):
             return True
 
         # If path has date-like pattern (YYYY/MM/DD or YYYY-MM-DD), likely an article
-        date_pattern = r"/\d{4}[/-]\d{1,2}[/-]\d{1,2}/"
-        if re.search(date_pattern, path):
+        if _DATE_PATH_RE.search(path):
             return True
 
         # If path is mostly empty (just domain), probably not an article
@@ -125,15 +166,27 @@ class ArticleExtractor:
         """
         try:
             logger.debug(f"Fetching article content from: {url}")
-            response = self.client.get(url)
-            response.raise_for_status()
-
-            content_type = response.headers.get("content-type", "").lower()
-            if "text/html" not in content_type:
-                logger.debug(f"URL does not contain HTML content: {content_type}")
+            fetched = self._fetch_html(url)
+            if fetched is None:
                 return None
 
-            html_content = response.text
+            html_content, main_text = fetched
+            if main_text:
+                logger.info(f"Extracted {len(main_text)} characters while streaming")
+                return main_text
+
+            # Parse once with lxml; the tree serves the fast path and the fallback
+            tree = None
+            if LXML_AVAILABLE:
+                try:
+                    tree = html.fromstring(html_content)
+                    etree.strip_elements(tree, "script", "style", with_tail=False)
+                    text_content = self._extract_main_node(tree)
+                    if text_content:
+                        return text_content
+                except Exception as e:
+                    logger.warning(f"lxml parsing failed: {e}, trying readability")
+                    tree = None
 
             if READABILITY_AVAILABLE:
                 # Use readability-lxml for better extraction
@@ -147,39 +200,32 @@ class ArticleExtractor:
                 except Exception as e:
                     logger.warning(f"Readability extraction failed: {e}, trying fallback")
 
+            if tree is not None:
+                text_content = self._extract_with_lxml(tree)
+                if text_content:
+                    return text_content
+
             # Fallback: basic extraction using regex
             # Remove script and style tags
-            cleaned_html = re.sub(
-                r"<script[^>]*>.*?</script>", "", html_content, flags=re.DOTALL | re.IGNORECASE
-            )
-            cleaned_html = re.sub(
-                r"<style[^>]*>.*?</style>", "", cleaned_html, flags=re.DOTALL | re.IGNORECASE
-            )
+            cleaned_html = _SCRIPT_RE.sub("", html_content)
+            cleaned_html = _STYLE_RE.sub("", cleaned_html)
 
             # Extract text from common article tags
-            article_patterns = [
-                r"<article[^>]*>(.*?)</article>",
-                r"<main[^>]*>(.*?)</main>",
-                r'<div[^>]*class="[^"]*content[^"]*"[^>]*>(.*?)</div>',
-                r'<div[^>]*class="[^"]*article[^"]*"[^>]*>(.*?)</div>',
-                r'<div[^>]*class="[^"]*post[^"]*"[^>]*>(.*?)</div>',
-            ]
-
-            for pattern in article_patterns:
-                matches = re.findall(pattern, cleaned_html, re.DOTALL | re.IGNORECASE)
+            for pattern in _ARTICLE_PATTERNS:
+                matches = pattern.findall(cleaned_html)
                 if matches:
                     # Extract text from HTML
-                    text_content = re.sub(r"<[^>]+>", " ", " ".join(matches))
-                    text_content = re.sub(r"\s+", " ", text_content).strip()
+                    text_content = _TAG_RE.sub(" ", " ".join(matches))
+                    text_content = _WS_RE.sub(" ", text_content).strip()
                     if len(text_content) > 100:
                         logger.info(f"Extracted {len(text_content)} characters using fallback method")
                         return text_content
 
             # Last resort: extract all text from body
-            body_match = re.search(r"<body[^>]*>(.*?)</body>", cleaned_html, re.DOTALL | re.IGNORECASE)
+            body_match = _BODY_RE.search(cleaned_html)
             if body_match:
-                text_content = re.sub(r"<[^>]+>", " ", body_match.group(1))
-                text_content = re.sub(r"\s+", " ", text_content).strip()
+                text_content = _TAG_RE.sub(" ", body_match.group(1))
+                text_content = _WS_RE.sub(" ", text_content).strip()
                 if len(text_content) > 100:
                     logger.info(f"Extracted {len(text_content)} characters from body")
                     return text_content
@@ -194,6 +240,143 @@ class ArticleExtractor:
             logger.warning(f"Error extracting article content: {e}")
             return None
 
+    def _fetch_html(self, url: str) -> Optional[tuple[Optional[str], Optional[str]]]:
+        """
+        Fetch a page body, skipping non-HTML and oversized responses.
+
+        The response is streamed so that headers can be checked before any of
+        the body is downloaded, and the download stops once MAX_CONTENT_BYTES is
+        exceeded. When lxml is available the chunks are also fed to a pull
+        parser as they arrive; once an <article> or <main> element with enough
+        text has been closed, the rest of the page is not downloaded.
+
+        Args:
+            url: URL to fetch
+
+        Returns:
+            Tuple of (decoded HTML, main content text), or None if the response
+            is not HTML or is too large. When main content was found while
+            streaming, the HTML is None; otherwise the main content is None.
+
+        Raises:
+            httpx.HTTPError: If the request fails
+        """
+        with self.client.stream("GET", url) as response:
+            response.raise_for_status()
+
+            content_type = response.headers.get("content-type", "").lower()
+            if "text/html" not in content_type:
+                logger.debug(f"URL does not contain HTML content: {content_type}")
+                return None
+
+            content_length = int(response.headers.get("content-length") or 0)
+            if content_length > self.MAX_CONTENT_BYTES:
+                logger.debug(f"Skipping {url}: content length {content_length} exceeds limit")
+                return None
+
+            pull_parser = None
+            if LXML_AVAILABLE:
+                pull_parser = etree.HTMLPullParser(
+                    events=("end",),
+                    tag=("article", "main"),
+                    encoding=response.charset_encoding,
+                )
+
+            chunks = []
+            size = 0
+            for chunk in response.iter_bytes(chunk_size=65536):
+                size += len(chunk)
+                if size > self.MAX_CONTENT_BYTES:
+                    logger.debug(f"Skipping {url}: body exceeds {self.MAX_CONTENT_BYTES} bytes")
+                    return None
+                chunks.append(chunk)
+
+                if pull_parser is not None:
+                    try:
+                        main_text = self._pull_main_text(pull_parser, chunk)
+                    except Exception as e:
+                        logger.debug(f"Streaming parse failed for {url}: {e}")
+                        pull_parser = None
+                    else:
+                        if main_text:
+                            return None, main_text
+
+            encoding = response.charset_encoding or "utf-8"
+            return b"".join(chunks).decode(encoding, errors="replace"), None
+
+    @staticmethod
+    def _pull_main_text(pull_parser, chunk: bytes) -> Optional[str]:
+        """
+        Feed a chunk to the pull parser and check newly closed main elements.
+
+        Args:
+            pull_parser: lxml HTMLPullParser filtering on article/main end events
+            chunk: Next chunk of the response body
+
+        Returns:
+            Text of the first closed element longer than 200 characters, or None
+        """
+        pull_parser.feed(chunk)
+        for _, element in pull_parser.read_events():
+            etree.strip_elements(element, "script", "style", with_tail=False)
+            text_content = " ".join(element.text_content().split())
+            if len(text_content) > 200:
+                return text_content
+        return None
+
+    def _extract_main_node(self, tree) -> Optional[str]:
+        """
+        Fast path: take the text of the first obvious main-content element.
+
+        Most article pages mark their content with <article>, <main> or a
+        well-known class, which is much cheaper to find than running
+        readability's scoring over the whole document.
+
+        Args:
+            tree: Parsed lxml document with script/style removed
+
+        Returns:
+            Text longer than 200 characters, or None if no main node was found
+        """
+        for xpath in _MAIN_CONTENT_XPATHS:
+            nodes = tree.xpath(xpath)
+            if nodes:
+                text_content = " ".join(nodes[0].text_content().split())
+                if len(text_content) > 200:
+                    logger.info(f"Extracted {len(text_content)} characters from main content")
+                    return text_content
+        return None
+
+    def _extract_with_lxml(self, tree) -> Optional[str]:
+        """
+        Extract article text from a parsed lxml document.
+
+        Args:
+            tree: Parsed lxml document with script/style removed
+
+        Returns:
+            Article text longer than 100 characters, or None if not found
+        """
+        for xpath in _ARTICLE_XPATHS:
+            elements = tree.xpath(xpath)
+            if elements:
+                text_content = " ".join(
+                    " ".join(element.text_content().split()) for element in elements
+                )
+                if len(text_content) > 100:
+                    logger.info(f"Extracted {len(text_content)} characters using lxml")
+                    return text_content
+
+        # Last resort: all text from body
+        body = tree.find(".//body")
+        if body is not None:
+            text_content = " ".join(body.text_content().split())
+            if len(text_content) > 100:
+                logger.info(f"Extracted {len(text_content)} characters from body")
+                return text_content
+
+        return None
+
     def extract_article_from_tweet(self, tweet_text: str) -> Optional[str]:
         """
         Extract article content from URLs found in tweet text.
@@ -217,6 +400,50 @@ class ArticleExtractor:
 
         return None
 
+    def extract_many(self, tweet_texts: list[str], workers: int = 8) -> list[Optional[str]]:
+        """
+        Extract article content for several tweets using a thread pool.
+
+        Preferred batch API for synchronous callers: HTTP I/O and lxml parsing
+        release the GIL, so fetches for different tweets overlap.
+
+        Args:
+            tweet_texts: Tweet texts that may contain URLs
+            workers: Maximum number of worker threads
+
+        Returns:
+            Article content (or None) for each tweet, in the same order as tweet_texts
+        """
+        if not tweet_texts:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(workers, len(tweet_texts))) as executor:
+            return list(executor.map(self.extract_article_from_tweet, tweet_texts))
+
+    async def extract_articles_from_tweets(
+        self, tweet_texts: list[str], concurrency: int = 8
+    ) -> list[Optional[str]]:
+        """
+        Extract article content for several tweets concurrently.
+
+        Each tweet is handled by extract_article_from_tweet in a worker thread,
+        so fetches for different tweets overlap instead of running back to back.
+
+        Args:
+            tweet_texts: Tweet texts that may contain URLs
+            concurrency: Maximum number of tweets processed at once
+
+        Returns:
+            Article content (or None) for each tweet, in the same order as tweet_texts
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def extract(tweet_text: str) -> Optional[str]:
+            async with semaphore:
+                return await asyncio.to_thread(self.extract_article_from_tweet, tweet_text)
+
+        return list(await asyncio.gather(*(extract(text) for text in tweet_texts)))
+
     def close(self):
         """Close the HTTP client."""
         self.client.close()
@@ -2,12 +2,20 @@
 
 import json
 import os
-from datetime import datetime, timedelta
+import time
+from collections import OrderedDict
+from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
 from loguru import logger
 
+# Parsed cache files shared by all TwitterCache instances in this process,
+# keyed by path and validated against the file's (mtime_ns, size).
+# Kept in least-recently-used order and capped at _MEMORY_CACHE_SIZE files.
+_MEMORY_CACHE_SIZE = 32
+_memory_cache: OrderedDict[Path, tuple[tuple[int, int], dict]] = OrderedDict()
+
 
 class TwitterCache:
     """File-based cache for Twitter API responses."""
@@ -41,22 +49,74 @@ class TwitterCache:
         safe_username = username.lower().replace("@", "")
         return self.cache_dir / f"tweets_{safe_username}.json"
 
-    def _is_expired(self, cache_data: dict) -> bool:
+    @staticmethod
+    def _read_json(path: Path) -> dict:
+        """Load a cache file, letting json decode the raw bytes directly."""
+        return json.loads(path.read_bytes())
+
+    @staticmethod
+    def _write_json(path: Path, cache_data: dict) -> None:
+        """Write a cache file as compact JSON, atomically."""
+        # Write to temp file first, then rename so readers never see a partial file
+        temp_file = path.with_suffix(".json.tmp")
+        temp_file.write_bytes(
+            json.dumps(cache_data, separators=(",", ":"), default=str).encode("utf-8")
+        )
+        os.replace(temp_file, path)
+
+    @staticmethod
+    def _cached_at_timestamp(cached_at: float | str) -> float:
         """
-        Check if cache entry is expired.
+        Convert a stored 'cached_at' value to a Unix timestamp.
 
         Args:
-            cache_data: Cached data dictionary with 'cached_at' timestamp
+            cached_at: Unix timestamp, or ISO-8601 string written by older versions
 
         Returns:
-            True if expired, False otherwise
+            Unix timestamp in seconds
         """
-        if "cached_at" not in cache_data:
-            return True
-        
-        cached_at = datetime.fromisoformat(cache_data["cached_at"])
-        expiry_time = cached_at + timedelta(hours=self.ttl_hours)
-        return datetime.now() > expiry_time
+        try:
+            return float(cached_at)
+        except (TypeError, ValueError):
+            return datetime.fromisoformat(cached_at).timestamp()
+
+    def _load_fresh(self, path: Path) -> Optional[dict]:
+        """
+        Load a cache file if it exists and is within the TTL.
+
+        Freshness is checked from the file's modification time so expired
+        entries are rejected without reading them. Parsed files are kept in
+        memory and reused while the file's mtime and size are unchanged, so
+        the returned data is shared and must not be mutated.
+
+        Args:
+            path: Cache file path
+
+        Returns:
+            Parsed cache data, or None if the file is missing or expired
+        """
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            return None
+
+        if time.time() - stat.st_mtime > self.ttl_hours * 3600:
+            logger.debug(f"Cache expired: {path.name}")
+            _memory_cache.pop(path, None)
+            return None
+
+        signature = (stat.st_mtime_ns, stat.st_size)
+        entry = _memory_cache.get(path)
+        if entry is not None and entry[0] == signature:
+            _memory_cache.move_to_end(path)
+            return entry[1]
+
+        cache_data = self._read_json(path)
+        _memory_cache[path] = (signature, cache_data)
+        _memory_cache.move_to_end(path)
+        if len(_memory_cache) > _MEMORY_CACHE_SIZE:
+            _memory_cache.popitem(last=False)
+        return cache_data
 
     def get_user_info(self, username: str) -> Optional[dict]:
         """
@@ -66,20 +126,18 @@ class TwitterCache:
             username: Twitter username
 
         Returns:
-            Cached user info dict or None if not found/expired
+            Cached user info dict or None if not found/expired. The dict is a
+            shallow copy; nested values are shared with the in-memory cache.
         """
         cache_path = self._get_user_info_path(username)
-        if not cache_path.exists():
-            return None
-
         try:
-            cache_data = json.loads(cache_path.read_text())
-            if self._is_expired(cache_data):
-                logger.debug(f"Cache expired for user info: @{username}")
+            cache_data = self._load_fresh(cache_path)
+            if cache_data is None:
                 return None
-            
+
             logger.debug(f"Cache hit for user info: @{username}")
-            return cache_data.get("data")
+            user_info = cache_data.get("data")
+            return dict(user_info) if isinstance(user_info, dict) else user_info
         except Exception as e:
             logger.warning(f"Error reading cache for user info @{username}: {e}")
             return None
@@ -95,12 +153,13 @@ class TwitterCache:
         cache_path = self._get_user_info_path(username)
         cache_data = {
             "username": username,
-            "cached_at": datetime.now().isoformat(),
+            "cached_at": time.time(),
             "data": user_info,
         }
         
         try:
-            cache_path.write_text(json.dumps(cache_data, indent=2, default=str))
+            _memory_cache.pop(cache_path, None)
+            self._write_json(cache_path, cache_data)
             logger.debug(f"Cached user info for @{username}")
         except Exception as e:
             logger.warning(f"Error writing cache for user info @{username}: {e}")
@@ -116,19 +175,18 @@ class TwitterCache:
                                    (False = return None if cache has less than 80% of requested)
 
         Returns:
-            List of cached tweet dicts or None if not found/expired/insufficient
+            List of cached tweet dicts or None if not found/expired/insufficient.
+            The list is a new copy, but the tweet dicts are shared with the
+            in-memory cache and must not be mutated.
         """
         cache_path = self._get_tweets_path(username)
-        if not cache_path.exists():
-            return None
-
         try:
-            cache_data = json.loads(cache_path.read_text())
-            if self._is_expired(cache_data):
-                logger.debug(f"Cache expired for tweets: @{username}")
+            cache_data = self._load_fresh(cache_path)
+            if cache_data is None:
                 return None
-            
-            tweets = cache_data.get("data", [])
+
+            # Copy the list so callers can reorder or extend it without touching the cache
+            tweets = list(cache_data.get("data", []))
             
             # If max_results is None or return_all_if_available is True, return all cached tweets
             if max_results is None or return_all_if_available:
@@ -173,12 +231,13 @@ class TwitterCache:
         cache_path = self._get_tweets_path(username)
         cache_data = {
             "username": username,
-            "cached_at": datetime.now().isoformat(),
+            "cached_at": time.time(),
             "data": tweets,
         }
         
         try:
-            cache_path.write_text(json.dumps(cache_data, indent=2, default=str))
+            _memory_cache.pop(cache_path, None)
+            self._write_json(cache_path, cache_data)
             logger.debug(f"Cached {len(tweets)} tweets for @{username}")
         except Exception as e:
             logger.warning(f"Error writing cache for tweets @{username}: {e}")
@@ -191,6 +250,7 @@ class TwitterCache:
             username: Twitter username
         """
         cache_path = self._get_user_info_path(username)
+        _memory_cache.pop(cache_path, None)
         if cache_path.exists():
             cache_path.unlink()
             logger.debug(f"Invalidated cache for user info: @{username}")
@@ -203,6 +263,7 @@ class TwitterCache:
             username: Twitter username
         """
         cache_path = self._get_tweets_path(username)
+        _memory_cache.pop(cache_path, None)
         if cache_path.exists():
             cache_path.unlink()
             logger.debug(f"Invalidated cache for tweets: @{username}")
@@ -223,9 +284,15 @@ class TwitterCache:
             return
         
         count = 0
-        for cache_file in self.cache_dir.glob("*.json"):
-            cache_file.unlink()
-            count += 1
+        with os.scandir(self.cache_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith(".json") and entry.is_file():
+                    os.unlink(entry.path)
+                    count += 1
+
+        # Every cached file in this directory is gone; drop their parsed copies
+        for path in [path for path in _memory_cache if path.parent == self.cache_dir]:
+            del _memory_cache[path]
         
         logger.info(f"Cleared {count} cache files")
 
@@ -252,9 +319,9 @@ class TwitterCache:
         user_info_path = self._get_user_info_path(username)
         if user_info_path.exists():
             try:
-                cache_data = json.loads(user_info_path.read_text())
-                cached_at = datetime.fromisoformat(cache_data["cached_at"])
-                age = (datetime.now() - cached_at).total_seconds() / 3600
+                cache_data = self._read_json(user_info_path)
+                cached_at = self._cached_at_timestamp(cache_data["cached_at"])
+                age = (time.time() - cached_at) / 3600
                 info["user_info_cached"] = True
                 info["user_info_age_hours"] = round(age, 2)
             except Exception:
@@ -264,9 +331,9 @@ class TwitterCache:
         tweets_path = self._get_tweets_path(username)
         if tweets_path.exists():
             try:
-                cache_data = json.loads(tweets_path.read_text())
-                cached_at = datetime.fromisoformat(cache_data["cached_at"])
-                age = (datetime.now() - cached_at).total_seconds() / 3600
+                cache_data = self._read_json(tweets_path)
+                cached_at = self._cached_at_timestamp(cache_data["cached_at"])
+                age = (time.time() - cached_at) / 3600
                 tweets = cache_data.get("data", [])
                 info["tweets_cached"] = True
                 info["tweets_age_hours"] = round(age, 2)
@@ -1,7 +1,8 @@
 """Calendar parser and scheduler for content proposals."""
 
+import bisect
 import json
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from pathlib import Path
 from typing import Optional
 
@@ -10,6 +11,65 @@ import yaml
 from twitter_agent.models.schemas import CalendarEvent
 
 
+# libyaml's C loader is several times faster; fall back when PyYAML lacks it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def _load_yaml(content: str | bytes):
+    """Parse YAML with the fastest available safe loader."""
+    return yaml.load(content, Loader=_YAML_LOADER)
+
+
+# Calendar parsers by file extension
+_LOADERS = {
+    ".yaml": _load_yaml,
+    ".yml": _load_yaml,
+    ".json": json.loads,
+}
+
+
+# dateutil is only imported the first time a date is not ISO 8601
+_dateutil_parser = None
+
+
+def _parse_date(date_str: str) -> datetime:
+    """Parse an ISO 8601 date, falling back to dateutil for other formats."""
+    global _dateutil_parser
+    try:
+        return datetime.fromisoformat(date_str.replace("Z", "+00:00"))
+    except ValueError:
+        # Try other date formats
+        if _dateutil_parser is None:
+            from dateutil import parser as _dateutil_parser
+        return _dateutil_parser.parse(date_str)
+
+
+def _parse_event(event_data: dict) -> Optional[CalendarEvent]:
+    """
+    Build a CalendarEvent from one raw calendar entry.
+
+    Args:
+        event_data: Event mapping from the calendar file
+
+    Returns:
+        CalendarEvent, or None if the entry has no date string
+    """
+    # Parse date
+    date_str = event_data.get("date") or event_data.get("datetime")
+    if isinstance(date_str, str):
+        event_date = _parse_date(date_str)
+    else:
+        return None
+
+    return CalendarEvent(
+        date=event_date,
+        title=event_data.get("title"),
+        description=event_data.get("description"),
+        tags=event_data.get("tags", []),
+        content_suggestions=event_data.get("content_suggestions", []),
+    )
+
+
 class CalendarError(Exception):
     """Custom exception for calendar errors."""
 
@@ -28,6 +88,8 @@ class CalendarProcessor:
         """
         self.calendar_file = Path(calendar_file) if calendar_file else None
         self.events: list[CalendarEvent] = []
+        self._by_date: dict[date, CalendarEvent] = {}
+        self._event_dates: list[datetime] = []
 
     def load_calendar(self, calendar_file: Optional[str] = None) -> list[CalendarEvent]:
         """
@@ -43,21 +105,28 @@ class CalendarProcessor:
             CalendarError: If file parsing fails
         """
         file_path = Path(calendar_file) if calendar_file else self.calendar_file
-        if not file_path or not file_path.exists():
+        if not file_path:
             return []
 
         try:
-            content = file_path.read_text(encoding="utf-8")
-            if file_path.suffix.lower() in {".yaml", ".yml"}:
-                data = yaml.safe_load(content)
-            elif file_path.suffix.lower() == ".json":
-                data = json.loads(content)
-            else:
-                # Try to parse as JSON first, then YAML
+            # Both parsers accept bytes, so skip decoding the file to str first
+            try:
+                content = file_path.read_bytes()
+            except FileNotFoundError:
+                return []
+
+            loader = _LOADERS.get(file_path.suffix.lower())
+            if loader is not None:
+                data = loader(content)
+            elif content.lstrip()[:1] in (b"{", b"["):
+                # Unknown extension that looks like JSON; YAML flow collections
+                # start the same way, so fall back to YAML if it isn't JSON
                 try:
                     data = json.loads(content)
                 except json.JSONDecodeError:
-                    data = yaml.safe_load(content)
+                    data = _load_yaml(content)
+            else:
+                data = _load_yaml(content)
 
             # Handle different formats
             events = []
@@ -69,29 +138,18 @@ class CalendarProcessor:
                 events_data = []
 
             for event_data in events_data:
-                # Parse date
-                date_str = event_data.get("date") or event_data.get("datetime")
-                if isinstance(date_str, str):
-                    try:
-                        event_date = datetime.fromisoformat(date_str.replace("Z", "+00:00"))
-                    except ValueError:
-                        # Try other date formats
-                        from dateutil import parser
-
-                        event_date = parser.parse(date_str)
-                else:
-                    continue
-
-                event = CalendarEvent(
-                    date=event_date,
-                    title=event_data.get("title"),
-                    description=event_data.get("description"),
-                    tags=event_data.get("tags", []),
-                    content_suggestions=event_data.get("content_suggestions", []),
-                )
-                events.append(event)
+                event = _parse_event(event_data)
+                if event is not None:
+                    events.append(event)
 
             self.events = sorted(events, key=lambda e: e.date)
+            self._event_dates = [event.date for event in self.events]
+
+            # Index the first (earliest) event of each day for date lookups
+            self._by_date = {}
+            for event in self.events:
+                self._by_date.setdefault(event.date.date(), event)
+
             return self.events
         except Exception as e:
             raise CalendarError(f"Failed to parse calendar file: {str(e)}") from e
@@ -115,7 +173,10 @@ class CalendarProcessor:
         now = datetime.now()
         cutoff = now + timedelta(days=days_ahead)
 
-        return [event for event in self.events if now <= event.date <= cutoff]
+        # Events are sorted by date, so the window is a contiguous slice
+        start = bisect.bisect_left(self._event_dates, now)
+        end = bisect.bisect_right(self._event_dates, cutoff)
+        return self.events[start:end]
 
     def get_event_for_date(self, target_date: datetime) -> Optional[CalendarEvent]:
         """
@@ -134,12 +195,7 @@ class CalendarProcessor:
                 return None
 
         # Match by date (ignoring time)
-        target_date_only = target_date.date()
-        for event in self.events:
-            if event.date.date() == target_date_only:
-                return event
-
-        return None
+        return self._by_date.get(target_date.date())
 
     def generate_schedule_hints(self, days_ahead: int = 7) -> str:
         """
@@ -1,8 +1,10 @@
 """Process text files from content directory for context."""
 
 import os
+import stat
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
 
 class FileProcessor:
@@ -10,6 +12,32 @@ class FileProcessor:
 
     SUPPORTED_EXTENSIONS = {".txt", ".md", ".markdown", ".rst"}
 
+    # Common interest keywords (this could be more sophisticated)
+    COMMON_INTERESTS = (
+        "technology",
+        "programming",
+        "ai",
+        "machine learning",
+        "python",
+        "javascript",
+        "web development",
+        "design",
+        "productivity",
+        "business",
+        "startup",
+        "marketing",
+        "content",
+        "writing",
+        "reading",
+        "travel",
+        "food",
+        "fitness",
+        "health",
+        "music",
+        "art",
+        "photography",
+    )
+
     def __init__(self, content_dir: str = "content"):
         """
         Initialize file processor.
@@ -18,53 +46,130 @@ class FileProcessor:
             content_dir: Directory containing content files
         """
         self.content_dir = Path(content_dir)
+        self._cache: Optional[dict[str, str]] = None
+        self._cache_signature: Optional[tuple[tuple[Path, int, int], ...]] = None
 
     def process_directory(self) -> dict[str, str]:
         """
         Process all text files in the content directory.
 
+        Results are cached and reused until a content file is added, removed or
+        modified, so repeated calls only stat the files instead of re-reading them.
+
         Returns:
             Dictionary mapping filenames to their content
         """
         if not self.content_dir.exists():
             return {}
 
-        content_map = {}
-        for file_path in self.content_dir.rglob("*"):
-            if file_path.is_file() and file_path.suffix.lower() in self.SUPPORTED_EXTENSIONS:
-                try:
-                    content = file_path.read_text(encoding="utf-8")
+        entries = [
+            (file_path, file_stat.st_mtime_ns, file_stat.st_size)
+            for file_path, file_stat in self._iter_content_files()
+        ]
+        signature = tuple(entries)
+        if self._cache is not None and signature == self._cache_signature:
+            return dict(self._cache)
+
+        file_paths = [file_path for file_path, _, _ in entries]
+        if not file_paths:
+            return {}
+
+        # Reads are I/O bound, so overlap them across a small thread pool
+        with ThreadPoolExecutor(max_workers=min(32, len(file_paths))) as executor:
+            contents = executor.map(self._read_file, file_paths)
+
+            content_map = {}
+            for file_path, content in zip(file_paths, contents):
+                # Skip files that can't be read
+                if content is not None:
                     # Use relative path as key
                     rel_path = file_path.relative_to(self.content_dir)
                     content_map[str(rel_path)] = content
-                except Exception as e:
-                    # Skip files that can't be read
-                    continue
 
-        return content_map
+        self._cache = content_map
+        self._cache_signature = signature
+        return dict(content_map)
+
+    def _iter_content_files(self) -> Iterator[tuple[Path, os.stat_result]]:
+        """Yield (path, stat) for every supported regular file under the content directory."""
+        for file_path in self.content_dir.rglob("*"):
+            if file_path.suffix.lower() not in self.SUPPORTED_EXTENSIONS:
+                continue
+            try:
+                file_stat = file_path.stat()
+            except OSError:
+                continue
+            if stat.S_ISREG(file_stat.st_mode):
+                yield file_path, file_stat
+
+    @staticmethod
+    def _read_prefix(file_path: Path, limit: int) -> Optional[str]:
+        """
+        Read up to ``limit`` characters of a content file.
+
+        The rest of the file is still decoded in chunks and discarded, so files
+        that are not valid UTF-8 are rejected just like ``_read_file`` does.
+
+        Returns:
+            The first ``limit`` characters, or None if the file can't be read
+        """
+        try:
+            with file_path.open(encoding="utf-8") as f:
+                content = f.read(limit)
+                while f.read(64 * 1024):
+                    pass
+            return content
+        except Exception:
+            return None
+
+    @staticmethod
+    def _read_file(file_path: Path) -> Optional[str]:
+        """Read a content file, returning None if it can't be read."""
+        try:
+            return file_path.read_text(encoding="utf-8")
+        except Exception:
+            return None
 
     def get_content_summary(self, max_chars: int = 5000) -> str:
         """
         Get a summary of all content files.
 
+        Files are read in directory order and only the part within the remaining
+        character budget is kept in memory. Each visited file is still decoded to
+        the end, so files that are not valid UTF-8 are skipped as in
+        ``process_directory``.
+
         Args:
             max_chars: Maximum characters to include in summary
 
         Returns:
             Combined content summary
         """
-        content_map = self.process_directory()
-        if not content_map:
+        if not self.content_dir.exists():
             return "No content files found in directory."
 
         summary_parts = []
         current_length = 0
+        found_files = False
 
-        for filename, content in content_map.items():
+        for file_path, _ in self._iter_content_files():
+            if found_files and current_length >= max_chars:
+                break
+
+            filename = file_path.relative_to(self.content_dir)
+            header = f"\n--- Content from {filename} ---\n"
+            # Anything beyond the remaining budget would be truncated anyway
+            content = self._read_prefix(file_path, max(max_chars - current_length - len(header), 0))
+            if content is None:
+                # Skip files that can't be read
+                continue
+            found_files = True
             if current_length >= max_chars:
+                # Nothing fits the budget; the readable file only rules out the
+                # "no content files" message
                 break
 
-            file_summary = f"\n--- Content from {filename} ---\n{content}\n"
+            file_summary = f"{header}{content}\n"
             if current_length + len(file_summary) > max_chars:
                 # Truncate last file
                 remaining = max_chars - current_length
@@ -75,6 +180,9 @@ class FileProcessor:
                 summary_parts.append(file_summary)
                 current_length += len(file_summary)
 
+        if not found_files:
+            return "No content files found in directory."
+
         return "".join(summary_parts)
 
     def extract_interests(self) -> list[str]:
@@ -91,41 +199,18 @@ class FileProcessor:
         if not content_map:
             return []
 
-        # Simple keyword extraction (can be enhanced with NLP)
-        all_text = " ".join(content_map.values()).lower()
-
-        # Common interest keywords (this could be more sophisticated)
-        common_interests = [
-            "technology",
-            "programming",
-            "ai",
-            "machine learning",
-            "python",
-            "javascript",
-            "web development",
-            "design",
-            "productivity",
-            "business",
-            "startup",
-            "marketing",
-            "content",
-            "writing",
-            "reading",
-            "travel",
-            "food",
-            "fitness",
-            "health",
-            "music",
-            "art",
-            "photography",
-        ]
-
-        found_interests = []
-        for interest in common_interests:
-            if interest in all_text:
-                found_interests.append(interest)
+        # Simple keyword extraction (can be enhanced with NLP). Scan file by file
+        # and stop looking for an interest once it has been found.
+        remaining = list(self.COMMON_INTERESTS)
+        found = set()
+        for content in content_map.values():
+            lowered = content.lower()
+            found.update(interest for interest in remaining if interest in lowered)
+            remaining = [interest for interest in remaining if interest not in found]
+            if not remaining:
+                break
 
-        return found_interests
+        return [interest for interest in self.COMMON_INTERESTS if interest in found]
 
     def get_files_count(self) -> int:
         """Get the number of content files found."""
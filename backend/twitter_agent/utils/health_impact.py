@@ -3,15 +3,17 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Iterable
 
 from twitter_agent.models.schemas import ContentType
+from twitter_agent.utils.length_score import score_length
 
 
-@dataclass
+@dataclass(frozen=True)
 class HealthImpact:
-    impacts: list[dict[str, object]]
-    followups: list[str]
+    impacts: tuple[dict[str, object], ...]
+    followups: tuple[str, ...]
 
 
 def estimate_health_impact(
@@ -20,7 +22,20 @@ def estimate_health_impact(
     content_type: ContentType,
     virality_components: dict[str, float],
 ) -> HealthImpact:
-    texts = content if isinstance(content, list) else [content]
+    texts = tuple(content) if isinstance(content, list) else (content,)
+    components = tuple(sorted(virality_components.items()))
+    impacts, followups = _estimate_cached(texts, content_type, components)
+    # Cached impacts are stored as item tuples; hand each caller its own dicts
+    return HealthImpact(impacts=tuple(dict(impact) for impact in impacts), followups=followups)
+
+
+@lru_cache(maxsize=1024)
+def _estimate_cached(
+    texts: tuple[str, ...],
+    content_type: ContentType,
+    components: tuple[tuple[str, float], ...],
+) -> tuple[tuple[tuple[tuple[str, object], ...], ...], tuple[str, ...]]:
+    virality_components = dict(components)
     lengths = [len(text.strip()) for text in texts if text.strip()]
     avg_length = sum(lengths) / len(lengths) if lengths else 0
 
@@ -30,7 +45,7 @@ def estimate_health_impact(
     clarity = virality_components.get("clarity", 0.0)
     negative_risk = virality_components.get("negative_risk", 0.0)
 
-    length_score = _length_score(avg_length, content_type)
+    length_score = score_length(avg_length, content_type)
 
     impacts: list[dict[str, object]] = []
 
@@ -90,27 +105,7 @@ def estimate_health_impact(
         dwell_potential=dwell_potential,
     )
 
-    return HealthImpact(impacts=impacts[:4], followups=followups[:4])
-
-
-def _length_score(avg_length: float, content_type: ContentType) -> float:
-    if content_type == ContentType.REPLY:
-        ideal_min, ideal_max = 60, 200
-    elif content_type == ContentType.QUOTE:
-        ideal_min, ideal_max = 80, 200
-    elif content_type == ContentType.THREAD:
-        ideal_min, ideal_max = 120, 260
-    else:
-        ideal_min, ideal_max = 100, 220
-
-    min_value, max_value = 30, 280
-    if avg_length <= min_value or avg_length >= max_value:
-        return 0.0
-    if avg_length < ideal_min:
-        return (avg_length - min_value) / max(ideal_min - min_value, 1)
-    if avg_length > ideal_max:
-        return max(0.0, (max_value - avg_length) / max(max_value - ideal_max, 1))
-    return 1.0
+    return tuple(tuple(impact.items()) for impact in impacts[:4]), tuple(followups[:4])
 
 
 def _followup_suggestions(
@@ -139,8 +134,4 @@ def _followup_suggestions(
         suggestions.append("Standalone tweet with a clear takeaway")
 
     # Deduplicate while preserving order
-    deduped: list[str] = []
-    for item in suggestions:
-        if item not in deduped:
-            deduped.append(item)
-    return deduped
+    return list(dict.fromkeys(suggestions))
@@ -0,0 +1,29 @@
+"""Shared length scoring for virality and health impact estimates."""
+
+from __future__ import annotations
+
+from functools import lru_cache
+
+from twitter_agent.models.schemas import ContentType
+
+# Ideal (min, max) character range per content type; standalone tweets use the default
+_IDEAL_BY_TYPE: dict[ContentType, tuple[int, int]] = {
+    ContentType.REPLY: (60, 200),
+    ContentType.QUOTE: (80, 200),
+    ContentType.THREAD: (120, 260),
+}
+_DEFAULT_IDEAL = (100, 220)
+
+
+@lru_cache(maxsize=4 * 281)
+def score_length(length: float, content_type: ContentType) -> float:
+    """Score how close a text length is to the ideal range for its content type (0-1)."""
+    ideal_min, ideal_max = _IDEAL_BY_TYPE.get(content_type, _DEFAULT_IDEAL)
+    min_value, max_value = 30, 280
+    if length <= min_value or length >= max_value:
+        return 0.0
+    if length < ideal_min:
+        return (length - min_value) / max(ideal_min - min_value, 1)
+    if length > ideal_max:
+        return max(0.0, (max_value - length) / max(max_value - ideal_max, 1))
+    return 1.0
@@ -3,10 +3,12 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 import re
-from typing import Iterable
+import string
 
 from twitter_agent.models.schemas import ContentType
+from twitter_agent.utils.length_score import score_length
 
 ENGAGEMENT_BAIT_PATTERNS = [
     r"\brt if\b",
@@ -77,6 +79,60 @@ HOOK_KEYWORDS = [
 ]
 
 
+def _index_keywords(buckets: dict[str, list[str]]) -> dict[str, frozenset[str]]:
+    """Map each distinct keyword to the buckets that list it."""
+    index: dict[str, set[str]] = {}
+    for name, keywords in buckets.items():
+        for keyword in keywords:
+            index.setdefault(keyword, set()).add(name)
+    return {keyword: frozenset(names) for keyword, names in index.items()}
+
+
+# Keywords shared by several buckets are only searched for once per text
+_BUCKETS_BY_KEYWORD = _index_keywords(
+    {
+        "share": SHARE_KEYWORDS,
+        "reply": REPLY_KEYWORDS,
+        "click": CLICK_KEYWORDS,
+    }
+)
+
+
+def _keyword_buckets(lowered: str) -> set[str]:
+    """Return the keyword buckets with at least one keyword in the lowercased text."""
+    found: set[str] = set()
+    for keyword, buckets in _BUCKETS_BY_KEYWORD.items():
+        if keyword in lowered:
+            found |= buckets
+    return found
+
+
+# Weights of the positive components in the aggregate score
+_SCORE_WEIGHTS = (
+    ("reply_potential", 0.2),
+    ("share_potential", 0.25),
+    ("click_potential", 0.1),
+    ("dwell_potential", 0.25),
+    ("clarity", 0.2),
+)
+
+_ASCII_LETTER_BYTES = string.ascii_letters.encode()
+_ASCII_UPPER_BYTES = string.ascii_uppercase.encode()
+_LIST_MARKERS = ("-", "*", "1.", "1)", "•")
+# Kept as separate patterns: each has a literal prefix the regex engine scans for
+# quickly, and numbers inside hashtags/mentions (e.g. "#2024") must still count.
+_RE_HASHTAG = re.compile(r"#\w+")
+_RE_MENTION = re.compile(r"@\w+")
+_RE_LINK = re.compile(r"https?://|www\.")
+_RE_SENT_SPLIT = re.compile(r"[.!?]+")
+_RE_WORD = re.compile(r"\b\w+\b")
+_RE_NUM = re.compile(r"\b\d+\b")
+_RE_BAD_WORDS = re.compile(r"\b(?:spam|giveaway|free money|pump)\b")
+_BAIT_RE = re.compile("|".join(ENGAGEMENT_BAIT_PATTERNS))
+# Hooks are checked against a short prefix, where one alternation beats per-keyword scans
+_HOOK_RE = re.compile("|".join(map(re.escape, HOOK_KEYWORDS)))
+
+
 @dataclass
 class ViralityResult:
     """Result of virality scoring."""
@@ -124,40 +180,60 @@ class ViralityScorer:
         return ViralityResult(score=round(score, 1), components=components, notes=notes)
 
     def _score_text(self, text: str, content_type: ContentType) -> ViralityResult:
+        score, components, notes = _score_text_cached(text, content_type)
+        return ViralityResult(score=score, components=dict(components), notes=list(notes))
+
+    @classmethod
+    def _analyze_text(cls, text: str, content_type: ContentType) -> ViralityResult:
         cleaned = text.strip()
         if not cleaned:
             return ViralityResult(score=0.0, components={}, notes=["Empty content"])
 
         length = len(cleaned)
-        letters = re.findall(r"[A-Za-z]", cleaned)
-        upper = sum(1 for c in cleaned if c.isupper())
-        uppercase_ratio = (upper / len(letters)) if letters else 0.0
 
+        # Character tallies run in C. ASCII bytes never occur inside multi-byte
+        # UTF-8 sequences, so deleting them from the encoded text counts exactly.
+        encoded = cleaned.encode("utf-8", "surrogatepass")
+        letters = len(encoded) - len(encoded.translate(None, _ASCII_LETTER_BYTES))
+        if cleaned.isascii():
+            upper = len(encoded) - len(encoded.translate(None, _ASCII_UPPER_BYTES))
+        else:
+            upper = sum(map(str.isupper, cleaned))
         question_marks = cleaned.count("?")
         exclamations = cleaned.count("!")
-        hashtags = len(re.findall(r"#\w+", cleaned))
-        mentions = len(re.findall(r"@\w+", cleaned))
-        has_link = bool(re.search(r"https?://|www\.", cleaned))
+        line_breaks = cleaned.count("\n")
+        has_list = any(line.lstrip().startswith(_LIST_MARKERS) for line in cleaned.splitlines())
 
-        sentences = [s.strip() for s in re.split(r"[.!?]+", cleaned) if s.strip()]
-        sentence_lengths = [len(re.findall(r"\b\w+\b", s)) for s in sentences]
-        avg_sentence_len = sum(sentence_lengths) / len(sentence_lengths) if sentence_lengths else 0
+        uppercase_ratio = (upper / letters) if letters else 0.0
 
-        line_breaks = cleaned.count("\n")
-        has_list = any(line.strip().startswith(("-", "*", "1.", "1)", "•")) for line in cleaned.splitlines())
-        number_count = len(re.findall(r"\b\d+\b", cleaned))
+        hashtags = len(_RE_HASHTAG.findall(cleaned))
+        mentions = len(_RE_MENTION.findall(cleaned))
+        has_link = bool(_RE_LINK.search(cleaned))
+
+        sent_count = 0
+        total_words = 0
+        for segment in _RE_SENT_SPLIT.split(cleaned):
+            segment = segment.strip()
+            if not segment:
+                continue
+            sent_count += 1
+            total_words += len(_RE_WORD.findall(segment))
+        avg_sentence_len = total_words / sent_count if sent_count else 0
+
+        number_count = len(_RE_NUM.findall(cleaned))
 
-        length_score = self._length_score(length, content_type)
+        keyword_buckets = _keyword_buckets(cleaned.lower())
+        length_score = score_length(length, content_type)
         structure_score = min(1.0, (0.4 if line_breaks >= 1 else 0.0) + (0.4 if has_list else 0.0) + (0.2 if number_count >= 1 else 0.0))
-        hook_score = self._hook_score(cleaned)
+        hook_score = cls._hook_score(cleaned)
 
-        reply_potential = min(1.0, (0.6 if question_marks > 0 else 0.0) + (0.4 if self._has_keywords(cleaned, REPLY_KEYWORDS) else 0.0))
-        share_potential = min(1.0, (0.3 if has_list or number_count >= 1 else 0.0) + (0.4 if self._has_keywords(cleaned, SHARE_KEYWORDS) else 0.0) + (0.3 if hook_score > 0.4 else 0.0))
-        click_potential = min(1.0, (0.6 if self._has_keywords(cleaned, CLICK_KEYWORDS) else 0.0) + (0.4 if has_link else 0.0))
+        reply_potential = min(1.0, (0.6 if question_marks > 0 else 0.0) + (0.4 if "reply" in keyword_buckets else 0.0))
+        share_potential = min(1.0, (0.3 if has_list or number_count >= 1 else 0.0) + (0.4 if "share" in keyword_buckets else 0.0) + (0.3 if hook_score > 0.4 else 0.0))
+        click_potential = min(1.0, (0.6 if "click" in keyword_buckets else 0.0) + (0.4 if has_link else 0.0))
         dwell_potential = min(1.0, (0.5 * length_score) + (0.3 * structure_score) + (0.2 * hook_score))
-        clarity = self._clarity_score(avg_sentence_len, length, exclamations)
+        clarity = cls._clarity_score(avg_sentence_len, length, exclamations)
 
-        negative_risk = self._negative_risk(
+        negative_risk = cls._negative_risk(
             cleaned,
             hashtags=hashtags,
             mentions=mentions,
@@ -174,7 +250,7 @@ class ViralityScorer:
             "negative_risk": negative_risk,
         }
 
-        notes = self._notes_from_components(
+        notes = cls._notes_from_components(
             reply_potential=reply_potential,
             share_potential=share_potential,
             click_potential=click_potential,
@@ -185,41 +261,14 @@ class ViralityScorer:
             content_type=content_type,
         )
 
-        return ViralityResult(score=self._aggregate_score(components), components=components, notes=notes)
+        return ViralityResult(score=cls._aggregate_score(components), components=components, notes=notes)
 
     @staticmethod
     def _aggregate_score(components: dict[str, float]) -> float:
-        weights = {
-            "reply_potential": 0.2,
-            "share_potential": 0.25,
-            "click_potential": 0.1,
-            "dwell_potential": 0.25,
-            "clarity": 0.2,
-        }
-        positive = sum(weights[key] * components.get(key, 0.0) for key in weights)
+        positive = sum(weight * components.get(key, 0.0) for key, weight in _SCORE_WEIGHTS)
         penalty = components.get("negative_risk", 0.0) * 20.0
         return max(0.0, min(100.0, positive * 100.0 - penalty))
 
-    @staticmethod
-    def _length_score(length: int, content_type: ContentType) -> float:
-        if content_type == ContentType.REPLY:
-            ideal_min, ideal_max = 60, 200
-        elif content_type == ContentType.QUOTE:
-            ideal_min, ideal_max = 80, 200
-        elif content_type == ContentType.THREAD:
-            ideal_min, ideal_max = 120, 260
-        else:
-            ideal_min, ideal_max = 100, 220
-
-        min_value, max_value = 30, 280
-        if length <= min_value or length >= max_value:
-            return 0.0
-        if length < ideal_min:
-            return (length - min_value) / max(ideal_min - min_value, 1)
-        if length > ideal_max:
-            return max(0.0, (max_value - length) / max(max_value - ideal_max, 1))
-        return 1.0
-
     @staticmethod
     def _clarity_score(avg_sentence_len: float, length: int, exclamations: int) -> float:
         if avg_sentence_len <= 0:
@@ -231,18 +280,13 @@ class ViralityScorer:
             base *= 0.8
         return max(0.0, min(1.0, base))
 
-    @staticmethod
-    def _has_keywords(text: str, keywords: Iterable[str]) -> bool:
-        lowered = text.lower()
-        return any(keyword in lowered for keyword in keywords)
-
     @staticmethod
     def _hook_score(text: str) -> float:
-        words = re.findall(r"\b\w+\b", text.lower())
+        words = _RE_WORD.findall(text.lower())
         first_words = " ".join(words[:12])
         if not first_words:
             return 0.0
-        return 1.0 if any(keyword in first_words for keyword in HOOK_KEYWORDS) else 0.3
+        return 1.0 if _HOOK_RE.search(first_words) else 0.3
 
     @staticmethod
     def _negative_risk(
@@ -255,7 +299,7 @@ class ViralityScorer:
     ) -> float:
         risk = 0.0
         lowered = text.lower()
-        if any(re.search(pattern, lowered) for pattern in ENGAGEMENT_BAIT_PATTERNS):
+        if _BAIT_RE.search(lowered):
             risk += 0.5
         if hashtags > 2:
             risk += 0.2
@@ -265,7 +309,7 @@ class ViralityScorer:
             risk += 0.1
         if uppercase_ratio > 0.35:
             risk += 0.2
-        if re.search(r"\b(?:spam|giveaway|free money|pump)\b", lowered):
+        if _RE_BAD_WORDS.search(lowered):
             risk += 0.2
         return min(1.0, risk)
 
@@ -302,3 +346,12 @@ class ViralityScorer:
                 notes.append("May be too long")
 
         return notes
+
+
+@lru_cache(maxsize=2048)
+def _score_text_cached(
+    text: str, content_type: ContentType
+) -> tuple[float, tuple[tuple[str, float], ...], tuple[str, ...]]:
+    """Score a single text, memoized as hashable tuples so results can be shared."""
+    result = ViralityScorer._analyze_text(text, content_type)
+    return result.score, tuple(result.components.items()), tuple(result.notes)